@@ -12,15 +12,21 @@ from scipp.core import concepts
 from ess.reduce.uncertainty import UncertaintyBroadcastMode
 
 from .conversions import ElasticCoordTransformGraph
+from .i_of_q import _bin_in_q
 from .logging import get_logger
 from .types import (
     BeamCenter,
     CleanDirectBeam,
+    CleanQ,
+    CleanSummedQ,
+    Denominator,
     DetectorBankSizes,
     DimsToKeep,
     IofQ,
     MaskedData,
+    MonitorTerm,
     NeXusComponent,
+    Numerator,
     QBins,
     ReturnEvents,
     SampleRun,
@@ -28,6 +34,11 @@ from .types import (
     WavelengthMask,
 )
 
+# Edges in phi of the quadrants. The dim is not called 'phi', since the data can
+# have a per-event phi coord (with gravity), while quadrants use the per-pixel mean.
+_QUADRANT_EDGES = sc.linspace('quadrant', -np.pi, np.pi, 5, unit='rad')
+_QUADRANTS = ('south-west', 'south-east', 'north-east', 'north-west')
+
 
 def _xy_extrema(pos: sc.Variable) -> sc.Variable:
     x_min = pos.fields.x.min()
@@ -92,9 +103,11 @@ def beam_center_from_center_of_mass(workflow: sciline.Pipeline) -> BeamCenter:
         low_counts = v.data < cutoff
     # See scipp/scipp#3271, the following lines are a workaround
     select = ~(low_counts | mask)
-    v = v.data[select]
+    v = v.data[select].values
     pos = pos[select]
-    com = sc.sum(pos * v) / v.sum()
+    # Weighted sum of all three components in a single pass, without an intermediate
+    # array of weighted position vectors
+    com = sc.vector(np.einsum('ij,i->j', pos.values, v) / v.sum(), unit=pos.unit)
 
     # We compute the shift between the incident beam direction and the center-of-mass
     incident_beam = summed.transform_coords('incident_beam', graph=graph).coords[
@@ -121,15 +134,18 @@ def _offsets_to_vector(data: sc.DataArray, xy: list[float], graph: dict) -> sc.V
     return center
 
 
-def _iofq_in_quadrants(
+def _iofq_by_quadrant(
     xy: list[float],
     workflow: sciline.Pipeline,
     detector: sc.DataArray,
     norm: sc.DataArray,
-) -> dict[str, sc.DataArray]:
+) -> sc.DataArray:
     """
     Compute the intensity as a function of Q inside 4 quadrants in Phi.
 
+    All quadrants are binned in a single pass, by using the pixel angle phi as an
+    additional binning coordinate next to ``Q``.
+
     Parameters
     ----------
     xy:
@@ -142,21 +158,32 @@ def _iofq_in_quadrants(
     Returns
     -------
     :
-        A dictionary containing the intensity as a function of Q in each quadrant.
-        The quadrants are named 'south-west', 'south-east', 'north-east', and
-        'north-west'.
+        The intensity as a function of Q, with an outer ``quadrant`` dimension of
+        length 4.
     """
-    pi = sc.constants.pi.value
-    phi_bins = sc.linspace('phi', -pi, pi, 5, unit='rad')
-    quadrants = ['south-west', 'south-east', 'north-east', 'north-west']
-
     graph = workflow.compute(ElasticCoordTransformGraph)
     workflow = workflow.copy()
     workflow[BeamCenter] = _offsets_to_vector(data=detector, xy=xy, graph=graph)
-    calibrated = workflow.compute(MaskedData[SampleRun])
-    with_phi = calibrated.transform_coords(
-        'phi', graph=graph, keep_intermediate=False, keep_inputs=False
+    workflow[CleanDirectBeam] = norm
+    results = workflow.compute(
+        (
+            MaskedData[SampleRun],
+            CleanQ[SampleRun, Numerator],
+            CleanQ[SampleRun, Denominator],
+            QBins,
+            DimsToKeep,
+        )
     )
+    numerator = results[CleanQ[SampleRun, Numerator]]
+    if 'phi' in numerator.coords or (
+        numerator.bins is not None and 'phi' in numerator.bins.coords
+    ):
+        # With gravity correction, phi is computed alongside Q and can be reused
+        with_phi = numerator
+    else:
+        with_phi = results[MaskedData[SampleRun]].transform_coords(
+            'phi', graph=graph, keep_intermediate=False, keep_inputs=False
+        )
     # If gravity-correction is enabled, phi depends on wavelength (and event).
     # We cannot handle this below, so we approximate phi by the mean value.
     if ('phi' not in with_phi.coords) and ('phi' in with_phi.bins.coords):
@@ -167,20 +194,64 @@ def _iofq_in_quadrants(
         if phi.bins is not None or 'wavelength' in phi.dims:
             phi = phi.mean('wavelength')
 
-    out = {}
-    for i, quad in enumerate(quadrants):
-        # Select pixels based on phi
-        sel = (phi >= phi_bins[i]) & (phi < phi_bins[i + 1])
-        # The beam center is applied when computing CalibratedDetector, set quadrant
-        # *before* that step.
-        workflow[NeXusComponent[snx.NXdetector, SampleRun]] = sc.DataGroup(
-            data=detector[sel]
+    for part in (Numerator, Denominator):
+        workflow[CleanSummedQ[SampleRun, part]] = _bin_in_quadrants(
+            results[CleanQ[SampleRun, part]],
+            phi=phi,
+            q_bins=results[QBins],
+            dims_to_keep=results[DimsToKeep],
         )
-        # MaskedData would be computed automatically, but we did it above already
-        workflow[MaskedData[SampleRun]] = calibrated[sel]
-        workflow[CleanDirectBeam] = norm if norm.dims == ('wavelength',) else norm[sel]
-        out[quad] = workflow.compute(IofQ[SampleRun])
-    return out
+    return workflow.compute(IofQ[SampleRun])
+
+
+def _bin_in_quadrants(
+    data: sc.DataArray,
+    phi: sc.Variable,
+    q_bins: int | sc.Variable,
+    dims_to_keep: tuple[str, ...],
+) -> sc.DataArray:
+    data = data.assign_coords(quadrant=phi)
+    if data.bins is not None:
+        # Binning by a pixel coord ignores pixel masks, so drop masked pixels first.
+        mask = concepts.irreducible_mask(data, dim=phi.dims)
+        if mask is not None:
+            data = data.drop_masks(
+                [name for name, m in data.masks.items() if set(m.dims) & set(phi.dims)]
+            )[~mask]
+    return _bin_in_q(
+        data=data,
+        edges={'quadrant': _QUADRANT_EDGES, 'Q': q_bins},
+        dims_to_keep=dims_to_keep,
+    )
+
+
+def _iofq_in_quadrants(
+    xy: list[float],
+    workflow: sciline.Pipeline,
+    detector: sc.DataArray,
+    norm: sc.DataArray,
+) -> dict[str, sc.DataArray]:
+    """
+    Compute the intensity as a function of Q inside 4 quadrants in Phi.
+
+    Parameters
+    ----------
+    xy:
+        The x,y offsets in the plane normal to the beam.
+    detector:
+        The raw detector.
+    norm:
+        The denominator data for normalization.
+
+    Returns
+    -------
+    :
+        A dictionary containing the intensity as a function of Q in each quadrant.
+        The quadrants are named 'south-west', 'south-east', 'north-east', and
+        'north-west'.
+    """
+    iofq = _iofq_by_quadrant(xy, workflow, detector, norm).drop_coords('quadrant')
+    return {quad: iofq['quadrant', i] for i, quad in enumerate(_QUADRANTS)}
 
 
 def _cost(xy: list[float], *args) -> float:
@@ -206,7 +277,7 @@ def _cost(xy: list[float], *args) -> float:
     xy:
         The x,y offsets in the plane normal to the beam.
     *args:
-        Arguments passed to :func:`iofq_in_quadrants`.
+        Arguments passed to :func:`_iofq_by_quadrant`.
 
     Returns
     -------
@@ -233,11 +304,19 @@ def _cost(xy: list[float], *args) -> float:
     one. The Mantid implementation is available
     `here <https://github.com/mantidproject/mantid/blob/main/Framework/PythonInterface/plugins/algorithms/WorkflowAlgorithms/SANS/SANSBeamCentreFinder.py`_.
     """  # noqa: E501
-    iofq = _iofq_in_quadrants(xy, *args)
-    all_q = sc.concat([sc.values(da) for da in iofq.values()], dim='quadrant')
-    ref = all_q.mean('quadrant')
-    c = (all_q - ref) ** 2
-    out = (sc.sum(ref * c) / sc.sum(ref)).value
+    iofq = sc.values(_iofq_by_quadrant(xy, *args))
+    ref = iofq.mean('quadrant')
+    # The final weighted sum is done in numpy to avoid scipp's per-op overhead.
+    # Masked entries (if any) are excluded, as sc.sum would do.
+    w = ref.values
+    c = iofq.transpose(['quadrant', *ref.dims]).values - w
+    if (mask := concepts.irreducible_mask(ref, dim=None)) is not None:
+        keep = ~mask.broadcast(sizes=ref.sizes).values
+        w = np.where(keep, w, 0.0)
+        c = np.where(keep, c, 0.0)
+    c = c.reshape(len(c), -1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = np.einsum('j,ij,ij->', w.ravel(), c, c) / w.sum()
     logger = get_logger('sans')
     if not np.isfinite(out):
         out = np.inf
@@ -385,6 +464,8 @@ def beam_center_from_iofq(
     workflow[WavelengthMask] = None
     workflow[WavelengthBands] = None
     workflow[QBins] = q_bins
+    # The monitor term of the denominator does not depend on the beam center
+    workflow[MonitorTerm[SampleRun]] = workflow.compute(MonitorTerm[SampleRun])
 
     # Use center of mass to get initial guess for beam center
     com_shift = beam_center_from_center_of_mass(workflow)
@@ -1,22 +1,32 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 
 class Registry:
     def __init__(self, instrument: str, files: dict[str, str], version: str):
+        self._instrument = instrument
+        self._files = files
+        self._version = version
+        self._fetched: dict[tuple[str, bool], str] = {}
+
+    @functools.cached_property
+    def _registry(self):
+        # Created on first fetch, so importing a data module does not import pooch
         import pooch
 
-        self._registry = pooch.create(
-            path=pooch.os_cache(f'ess/{instrument}'),
-            env=f'ESS_{instrument.upper()}_DATA_DIR',
-            base_url=f'https://public.esss.dk/groups/scipp/ess/{instrument}/'
+        return pooch.create(
+            path=pooch.os_cache(f'ess/{self._instrument}'),
+            env=f'ESS_{self._instrument.upper()}_DATA_DIR',
+            base_url=f'https://public.esss.dk/groups/scipp/ess/{self._instrument}/'
             + '{version}/',
-            version=version,
-            registry=files,
+            version=self._version,
+            registry=self._files,
         )
 
     def __contains__(self, key):
-        return key in self._registry.registry
+        return key in self._files
 
     def get_path(self, name: str, unzip: bool = False) -> str:
         """
@@ -29,9 +39,39 @@ class Registry:
         unzip:
             If `True`, unzip the file before returning the path.
         """
+        # pooch re-hashes the file on every fetch, which is slow for large files.
+        # Files that were already fetched and verified in this process are reused.
+        key = (name, unzip)
+        if key in self._fetched:
+            return self._fetched[key]
         import pooch
 
-        return self._registry.fetch(name, processor=pooch.Unzip() if unzip else None)
+        path = self._registry.fetch(name, processor=pooch.Unzip() if unzip else None)
+        self._fetched[key] = path
+        return path
+
+    def get_paths(self, names: list[str], unzip: bool = False) -> list[str]:
+        """
+        Get the paths to several files in the registry.
+
+        Files are fetched (downloaded or hash-checked) concurrently.
+
+        Parameters
+        ----------
+        names:
+            Names of the files to get the paths for.
+        unzip:
+            If `True`, unzip the files before returning the paths.
+        """
+        names = list(names)
+        if len(names) < 2:
+            return [self.get_path(name, unzip=unzip) for name in names]
+        # Create the registry up front, not concurrently in the workers
+        self._registry  # noqa: B018
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+            return list(
+                executor.map(lambda name: self.get_path(name, unzip=unzip), names)
+            )
 
 
 __all__ = ['Registry']
@@ -5,6 +5,7 @@ import scipp as sc
 from sciline import Pipeline
 
 from .i_of_q import resample_direct_beam
+from .logging import get_logger
 from .types import (
     BackgroundRun,
     BackgroundSubtractedIofQ,
@@ -12,6 +13,7 @@ from .types import (
     DirectBeam,
     Numerator,
     ProcessedWavelengthBands,
+    ReducedQ,
     SampleRun,
     WavelengthBands,
     WavelengthBins,
@@ -19,6 +21,25 @@ from .types import (
 )
 
 
+def _nanmedian(a: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Median along an axis, ignoring NaN.
+
+    If all lanes have the same number of NaN values, which is the common case, a
+    single partition is used instead of the slower generic path of ``np.nanmedian``.
+    """
+    a = np.moveaxis(a, axis, -1)
+    isnan = np.isnan(a)
+    counts = a.shape[-1] - isnan.sum(axis=-1)
+    n = counts.flat[0] if counts.size else 0
+    if n == 0 or np.any(counts != n):
+        return np.nanmedian(a, axis=-1)
+    # NaN are moved to the end, so the median is found among the first n values
+    kth = [(n - 1) // 2, n // 2]
+    part = np.partition(np.where(isnan, np.inf, a), kth, axis=-1)
+    return 0.5 * (part[..., kth[0]] + part[..., kth[1]])
+
+
 def _compute_efficiency_correction(
     iofq_full: sc.DataArray,
     iofq_bands: sc.DataArray,
@@ -41,18 +62,44 @@ def _compute_efficiency_correction(
     I0:
         The intensity of the I(Q) for the known sample at the lowest Q value.
     """
-    invalid = (iofq_bands.data <= sc.scalar(0.0)) | ~sc.isfinite(iofq_bands.data)
-    data = np.where(invalid.values, np.nan, (iofq_bands.data / iofq_full.data).values)
-    eff = np.nanmedian(data, axis=iofq_bands.dims.index('Q'))
+    bands = iofq_bands.values
+    # Align the full-range I(Q) with the bands by adding a length-1 band axis, so
+    # numpy broadcasts it in the division instead of copying it for every band.
+    band_axis = iofq_bands.dims.index(wavelength_band_dim)
+    full = np.expand_dims(
+        iofq_full.data.transpose(
+            [dim for dim in iofq_bands.dims if dim != wavelength_band_dim]
+        ).values,
+        band_axis,
+    )
+    # Invalid band values are left as NaN and ignored by the median
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.divide(
+            bands,
+            full,
+            out=np.full(bands.shape, np.nan),
+            where=(bands > 0.0) & np.isfinite(bands),
+        )
+    eff = _nanmedian(ratio, axis=iofq_bands.dims.index('Q'))
 
-    scaling = sc.values(iofq_full['Q', 0].data) / I0
+    scaling = sc.values(iofq_full.data['Q', 0]) / I0
     # Note: do not use a `set` here because the order of dimensions is important
-    dims = [dim for dim in iofq_bands.dims if dim != 'Q']
-    out = sc.array(dims=dims, values=eff) * scaling
-    return out.rename_dims({wavelength_band_dim: 'wavelength'})
+    dims = [
+        'wavelength' if dim == wavelength_band_dim else dim
+        for dim in iofq_bands.dims
+        if dim != 'Q'
+    ]
+    return sc.array(dims=dims, values=eff) * scaling
 
 
-def direct_beam(*, workflow: Pipeline, I0: sc.Variable, niter: int = 5) -> list[dict]:
+def direct_beam(
+    *,
+    workflow: Pipeline,
+    I0: sc.Variable,
+    niter: int = 5,
+    tolerance: float | None = None,
+    history: bool = True,
+) -> list[dict]:
     """
     Compute the direct beam function.
 
@@ -77,11 +124,8 @@ def direct_beam(*, workflow: Pipeline, I0: sc.Variable, niter: int = 5) -> list[
      4. Compare the full-range $I(Q)$ to a theoretical reference and add the
         corresponding additional scaling to the direct beam function
      5. Iterate a given number of times (typically less than 10) so as to gradually
-        converge on a direct beam function
-
-    TODO: For simplicity and robustness, we currently specify the number of times to
-    iterate. We could imagine in the future having a convergence criterion instead to
-    determine when to stop iterating.
+        converge on a direct beam function, or until the correction applied in an
+        iteration falls below a given tolerance
 
     Parameters
     ----------
@@ -90,7 +134,14 @@ def direct_beam(*, workflow: Pipeline, I0: sc.Variable, niter: int = 5) -> list[
     I0:
         The intensity of the I(Q) for the known sample at the lowest Q value.
     niter:
-        The number of iterations to perform.
+        The maximum number of iterations to perform.
+    tolerance:
+        If given, stop iterating once the largest relative change of the direct beam
+        function in an iteration is below this value. Bands with a NaN correction
+        (no valid data) are ignored.
+    history:
+        If ``True``, return the results of all iterations. Otherwise only the results
+        of the last iteration are kept, which lowers memory usage.
     """
 
     direct_beam_function = None
@@ -102,6 +153,8 @@ def direct_beam(*, workflow: Pipeline, I0: sc.Variable, niter: int = 5) -> list[
     workflow[DirectBeam] = None
 
     wavelength_bins = workflow.compute(WavelengthBins)
+    # The resampled direct beam is always defined on wavelength_bins
+    wavelength_midpoints = sc.midpoints(wavelength_bins, dim='wavelength')
     parts = (
         WavelengthScaledQ[SampleRun, Numerator],
         WavelengthScaledQ[SampleRun, Denominator],
@@ -124,15 +177,28 @@ def direct_beam(*, workflow: Pipeline, I0: sc.Variable, niter: int = 5) -> list[
     sample0 = parts[WavelengthScaledQ[SampleRun, Denominator]]
     background0 = parts[WavelengthScaledQ[BackgroundRun, Denominator]]
 
+    # The numerators do not depend on the direct beam function, so they are reduced
+    # only once for the full wavelength range and for the bands.
+    numerators = (ReducedQ[SampleRun, Numerator], ReducedQ[BackgroundRun, Numerator])
+    reduced_numerators = {}
+    for wavelength_bands in (full_wavelength_range, bands):
+        workflow[WavelengthBands] = wavelength_bands
+        reduced_numerators[id(wavelength_bands)] = workflow.compute(numerators)
+
+    def compute_iofq(wavelength_bands: sc.Variable) -> sc.DataArray:
+        workflow[WavelengthBands] = wavelength_bands
+        for key, numerator in reduced_numerators[id(wavelength_bands)].items():
+            # Copy since the normalization divides the numerator in-place
+            workflow[key] = numerator.copy()
+        return workflow.compute(BackgroundSubtractedIofQ)
+
     results = []
 
-    for _it in range(niter):
+    for it in range(niter):
         # The first time we compute I(Q), the direct beam function is not in the
         # parameters, nor given by any providers, so it will be considered flat.
-        workflow[WavelengthBands] = full_wavelength_range
-        iofq_full = workflow.compute(BackgroundSubtractedIofQ)
-        workflow[WavelengthBands] = bands
-        iofq_bands = workflow.compute(BackgroundSubtractedIofQ)
+        iofq_full = compute_iofq(full_wavelength_range)
+        iofq_bands = compute_iofq(bands)
 
         if direct_beam_function is None:
             # Make a flat direct beam
@@ -142,12 +208,13 @@ def direct_beam(*, workflow: Pipeline, I0: sc.Variable, niter: int = 5) -> list[
                 coords={band_dim: sc.midpoints(bands, dim='wavelength').squeeze()},
             ).rename({band_dim: 'wavelength'})
 
-        direct_beam_function *= _compute_efficiency_correction(
+        correction = _compute_efficiency_correction(
             iofq_full=iofq_full,
             iofq_bands=iofq_bands,
             wavelength_band_dim=band_dim,
             I0=I0,
         )
+        direct_beam_function *= correction
 
         # Scale denominator terms that were initially computed without direct beam
         # with the current direct beam function.
@@ -155,12 +222,12 @@ def direct_beam(*, workflow: Pipeline, I0: sc.Variable, niter: int = 5) -> list[
             direct_beam=direct_beam_function,
             wavelength_bins=wavelength_bins,
         )
-        db.coords['wavelength'] = sc.midpoints(
-            db.coords['wavelength'], dim='wavelength'
-        )
+        db.coords['wavelength'] = wavelength_midpoints
         workflow[WavelengthScaledQ[SampleRun, Denominator]] = sample0 * db
         workflow[WavelengthScaledQ[BackgroundRun, Denominator]] = background0 * db
 
+        if not history:
+            results.clear()
         results.append(
             {
                 'iofq_full': iofq_full,
@@ -168,4 +235,12 @@ def direct_beam(*, workflow: Pipeline, I0: sc.Variable, niter: int = 5) -> list[
                 'direct_beam': direct_beam_function,
             }
         )
+        change = np.abs(correction.values - 1.0)
+        # Bands without any valid data (NaN correction) do not block convergence
+        delta = np.nan if np.isnan(change).all() else np.nanmax(change)
+        get_logger('sans').info(
+            'Direct beam iteration %s: max relative change %s', it, delta
+        )
+        if tolerance is not None and delta < tolerance:
+            break
     return results
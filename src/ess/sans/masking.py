@@ -62,6 +62,8 @@ def apply_pixel_masks(
     masks:
         A series of masks.
     """
+    if not masks:
+        return MaskedData[ScatteringRunType](data)
     return MaskedData[ScatteringRunType](data.assign_masks(masks))
 
 
@@ -91,6 +91,8 @@ def mask_solid_angle(
     solid_angle: SolidAngle[ScatteringRunType],
     masks: DetectorMasks,
 ) -> MaskedSolidAngle[ScatteringRunType]:
+    if not masks:
+        return MaskedSolidAngle[ScatteringRunType](solid_angle)
     return MaskedSolidAngle[ScatteringRunType](solid_angle.assign_masks(masks))
 
 
@@ -1,5 +1,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+import functools
+import operator
+import uuid
 from collections.abc import Hashable, Iterable
 
 import pandas as pd
@@ -34,14 +37,45 @@ from .types import (
 
 
 def _merge(*dicts: dict) -> dict:
-    return {key: value for d in dicts for key, value in d.items()}
+    return functools.reduce(operator.ior, dicts, {})
+
+
+def _make_param_table(
+    key: Hashable,
+    values: Iterable,
+    axis_name: str,
+    index: Iterable[Hashable] | None = None,
+) -> pd.DataFrame:
+    """Build a single-column parameter table with a named index for mapping."""
+    values = tuple(values)
+    if index is None:
+        index = pd.RangeIndex(len(values), name=axis_name)
+    else:
+        index = pd.Index(index, name=axis_name)
+    return pd.DataFrame({key: values}, index=index)
 
 
 def merge_contributions(*data: sc.DataArray) -> sc.DataArray:
     if len(data) == 1:
         return data[0]
-    reducer = sc.reduce(data)
-    return reducer.bins.concat() if data[0].bins is not None else reducer.sum()
+    first, *rest = data
+    binned = first.bins is not None
+    # Masks that differ between contributions must be applied when reducing, and
+    # coords that differ (such as per-run L1) must be dropped. Both require the
+    # general concat-based path below.
+    same_meta = not isinstance(first, sc.DataArray) or all(
+        da.masks == first.masks and da.coords == first.coords for da in rest
+    )
+    if same_meta and binned and len(rest) == 1:
+        return first.bins.concatenate(rest[0])
+    if same_meta and not binned:
+        out = first.copy()
+        for da in rest:
+            out += da
+        return out
+    dim = uuid.uuid4().hex
+    combined = sc.concat(data, dim=dim)
+    return combined.bins.concat(dim) if binned else combined.sum(dim)
 
 
 def with_pixel_mask_filenames(
@@ -60,7 +94,7 @@ def with_pixel_mask_filenames(
     workflow = workflow.copy()
     workflow[DetectorMasks] = (
         workflow[DetectorMasks]
-        .map(pd.DataFrame({PixelMaskFilename: masks}).rename_axis('mask'))
+        .map(_make_param_table(PixelMaskFilename, masks, 'mask'))
         .reduce(index='mask', func=_merge)
     )
     return workflow
@@ -87,23 +121,24 @@ def with_banks(
     index:
         Index to use for the DataFrame. If not provided, the bank names are used.
     """
+    banks = tuple(banks)
     index = index or banks
-    return workflow.map(
-        pd.DataFrame({NeXusDetectorName: banks}, index=index).rename_axis('bank')
-    )
+    return workflow.map(_make_param_table(NeXusDetectorName, banks, 'bank', index))
 
 
 def _set_runs(
     pipeline: sciline.Pipeline, runs: Iterable[str], key: Hashable, axis_name: str
 ) -> sciline.Pipeline:
+    runs = _make_param_table(Filename[key], runs, axis_name)
+    merged = {
+        target: pipeline[target]
+        .map(runs)
+        .reduce(index=axis_name, func=merge_contributions)
+        for target in (CleanSummedQ[key, Numerator], CleanSummedQ[key, Denominator])
+    }
     pipeline = pipeline.copy()
-    runs = pd.DataFrame({Filename[key]: runs}).rename_axis(axis_name)
-    for part in (Numerator, Denominator):
-        pipeline[CleanSummedQ[key, part]] = (
-            pipeline[CleanSummedQ[key, part]]
-            .map(runs)
-            .reduce(index=axis_name, func=merge_contributions)
-        )
+    for target, graph in merged.items():
+        pipeline[target] = graph
     return pipeline
 
 
@@ -162,15 +197,8 @@ to setup a complete workflow.
 """
 
 
-def SansWorkflow() -> sciline.Pipeline:
-    """
-    Common base for SANS workflows.
-
-    Returns
-    -------
-    :
-        SANS workflow as a sciline.Pipeline
-    """
+@functools.cache
+def _sans_workflow() -> sciline.Pipeline:
     workflow = GenericNeXusWorkflow(
         run_types=(
             SampleRun,
@@ -184,9 +212,25 @@ def SansWorkflow() -> sciline.Pipeline:
     for provider in providers:
         workflow.insert(provider)
     workflow[CorrectForGravity] = CorrectForGravity(False)
-    workflow[DetectorBankSizes] = DetectorBankSizes({})
     workflow[DimsToKeep] = DimsToKeep(())
     workflow[TransformationPath] = TransformationPath('transform')
     workflow[WavelengthBands] = WavelengthBands(None)
     workflow[WavelengthMask] = WavelengthMask(None)
     return workflow
+
+
+def SansWorkflow() -> sciline.Pipeline:
+    """
+    Common base for SANS workflows.
+
+    Returns
+    -------
+    :
+        SANS workflow as a sciline.Pipeline
+    """
+    # Building the workflow is comparatively slow, so it is done only once.
+    # Pipeline.copy does not copy parameter values, so mutable defaults are set on
+    # the copy to avoid sharing them between workflows.
+    workflow = _sans_workflow().copy()
+    workflow[DetectorBankSizes] = DetectorBankSizes({})
+    return workflow
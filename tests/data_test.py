@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from ess.sans.data import Registry
+
+_VERSION = '1'
+
+
+@pytest.fixture
+def registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Registry:
+    monkeypatch.setenv('ESS_LOCALTEST_DATA_DIR', str(tmp_path))
+    (tmp_path / _VERSION).mkdir()
+    files = {}
+    for name in ('a.txt', 'b.txt', 'c.txt'):
+        content = name.encode()
+        (tmp_path / _VERSION / name).write_bytes(content)
+        files[name] = f'sha256:{hashlib.sha256(content).hexdigest()}'
+    return Registry(instrument='localtest', files=files, version=_VERSION)
+
+
+def test_registry_get_path_returns_local_file(registry: Registry) -> None:
+    path = Path(registry.get_path('b.txt'))
+    assert path.name == 'b.txt'
+    assert path.read_text() == 'b.txt'
+
+
+def test_registry_get_path_does_not_fetch_again(
+    registry: Registry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+    fetch = registry._registry.fetch
+
+    def counting_fetch(name, **kwargs):
+        calls.append(name)
+        return fetch(name, **kwargs)
+
+    monkeypatch.setattr(registry._registry, 'fetch', counting_fetch)
+    first = registry.get_path('a.txt')
+    assert registry.get_path('a.txt') == first
+    assert calls == ['a.txt']
+
+
+def test_registry_get_paths_preserves_order(registry: Registry) -> None:
+    names = ['c.txt', 'a.txt', 'b.txt']
+    paths = registry.get_paths(names)
+    assert [Path(path).name for path in paths] == names
+
+
+def test_registry_get_paths_with_single_name(registry: Registry) -> None:
+    assert registry.get_paths(['a.txt']) == [registry.get_path('a.txt')]
+    assert registry.get_paths([]) == []
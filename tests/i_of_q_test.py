@@ -25,6 +25,20 @@ def test_merge_banks_or_runs_sums_dense_data() -> None:
     )
 
 
+def test_merge_banks_or_runs_sums_dense_data_of_more_than_two_contributions() -> None:
+    data = [
+        sc.DataArray(data=sc.array(dims=['Q'], values=[1.0, 2.0])),
+        sc.DataArray(data=sc.array(dims=['Q'], values=[3.0, 4.0])),
+        sc.DataArray(data=sc.array(dims=['Q'], values=[5.0, 6.0])),
+    ]
+    assert sc.identical(
+        merge_func(*data),
+        sc.DataArray(
+            data=sc.array(dims=['Q'], values=[9.0, 12.0]),
+        ),
+    )
+
+
 def test_merge_banks_or_runs_concats_bins() -> None:
     events1 = sc.DataArray(data=sc.array(dims=['event'], values=[1.0, 2.0, 3.0]))
     events2 = sc.DataArray(data=sc.array(dims=['event'], values=[4.0, 5.0]))
@@ -49,3 +63,115 @@ def test_merge_banks_or_runs_concats_bins() -> None:
         data=expected_events,
     )
     assert sc.identical(merge_func(*data), expected)
+
+
+def test_merge_banks_or_runs_concats_bins_of_more_than_two_contributions() -> None:
+    events1 = sc.DataArray(data=sc.array(dims=['event'], values=[1.0, 2.0, 3.0]))
+    events2 = sc.DataArray(data=sc.array(dims=['event'], values=[4.0, 5.0]))
+    events3 = sc.DataArray(data=sc.array(dims=['event'], values=[6.0]))
+    data = [
+        sc.bins(
+            begin=sc.array(dims=['Q'], values=[0, 1], unit=None),
+            dim='event',
+            data=events1,
+        ),
+        sc.bins(
+            begin=sc.array(dims=['Q'], values=[0, 2], unit=None),
+            dim='event',
+            data=events2,
+        ),
+        sc.bins(
+            begin=sc.array(dims=['Q'], values=[0, 0], unit=None),
+            dim='event',
+            data=events3,
+        ),
+    ]
+    expected_events = sc.DataArray(
+        data=sc.array(dims=['event'], values=[1.0, 4.0, 5.0, 2.0, 3.0, 6.0]),
+    )
+    expected = sc.bins(
+        begin=sc.array(dims=['Q'], values=[0, 3], unit=None),
+        dim='event',
+        data=expected_events,
+    )
+    assert sc.identical(merge_func(*data), expected)
+
+
+def test_merge_banks_or_runs_applies_masks_that_differ_between_contributions() -> None:
+    data = [
+        sc.DataArray(
+            data=sc.array(dims=['Q'], values=[1.0, 2.0]),
+            masks={'m': sc.array(dims=['Q'], values=[True, False])},
+        ),
+        sc.DataArray(
+            data=sc.array(dims=['Q'], values=[3.0, 4.0]),
+            masks={'m': sc.array(dims=['Q'], values=[False, False])},
+        ),
+    ]
+    assert sc.identical(
+        merge_func(*data),
+        sc.DataArray(data=sc.array(dims=['Q'], values=[3.0, 6.0])),
+    )
+
+
+def test_merge_banks_or_runs_preserves_masks_shared_by_all_contributions() -> None:
+    mask = sc.array(dims=['Q'], values=[True, False])
+    data = [
+        sc.DataArray(
+            data=sc.array(dims=['Q'], values=[1.0, 2.0]), masks={'m': mask.copy()}
+        ),
+        sc.DataArray(
+            data=sc.array(dims=['Q'], values=[3.0, 4.0]), masks={'m': mask.copy()}
+        ),
+    ]
+    assert sc.identical(
+        merge_func(*data),
+        sc.DataArray(data=sc.array(dims=['Q'], values=[4.0, 6.0]), masks={'m': mask}),
+    )
+
+
+def _with_unaligned_coord(da: sc.DataArray, name: str, value: float) -> sc.DataArray:
+    da = da.assign_coords({name: sc.scalar(value, unit='m')})
+    da.coords.set_aligned(name, False)
+    return da
+
+
+def test_merge_banks_or_runs_drops_dense_coords_that_differ() -> None:
+    data = [
+        _with_unaligned_coord(
+            sc.DataArray(data=sc.array(dims=['Q'], values=[1.0, 2.0])), 'L1', value
+        )
+        for value in (1.0, 2.0)
+    ]
+    assert sc.identical(
+        merge_func(*data),
+        sc.DataArray(data=sc.array(dims=['Q'], values=[2.0, 4.0])),
+    )
+
+
+def test_merge_banks_or_runs_drops_binned_coords_that_differ() -> None:
+    events = sc.DataArray(data=sc.array(dims=['event'], values=[1.0, 2.0]))
+    binned = sc.DataArray(
+        sc.bins(
+            begin=sc.array(dims=['Q'], values=[0, 1], unit=None),
+            dim='event',
+            data=events,
+        )
+    )
+    data = [_with_unaligned_coord(binned, 'L1', value) for value in (1.0, 2.0)]
+    assert 'L1' not in merge_func(*data).coords
+
+
+def test_merge_banks_or_runs_preserves_coords_shared_by_all_contributions() -> None:
+    data = [
+        _with_unaligned_coord(
+            sc.DataArray(data=sc.array(dims=['Q'], values=[1.0, 2.0])), 'L1', 1.0
+        )
+        for _ in range(2)
+    ]
+    assert sc.identical(
+        merge_func(*data),
+        _with_unaligned_coord(
+            sc.DataArray(data=sc.array(dims=['Q'], values=[2.0, 4.0])), 'L1', 1.0
+        ),
+    )
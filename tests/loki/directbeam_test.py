@@ -3,6 +3,7 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 import scipp as sc
 from scipp.scipy.interpolate import interp1d
 
@@ -46,6 +47,54 @@ def test_can_compute_direct_beam_for_all_pixels():
     assert direct_beam_function.sizes['wavelength'] == n_wavelength_bands
 
 
+def test_direct_beam_stops_iterating_when_tolerance_is_reached():
+    n_wavelength_bands = 10
+    pipeline = make_workflow()
+    edges = pipeline.compute(WavelengthBins)
+    pipeline[WavelengthBands] = sc.linspace(
+        'wavelength', edges.min(), edges.max(), n_wavelength_bands + 1
+    )
+    pipeline[BeamCenter] = sc.vector([0, 0, 0], unit='m')
+    I0 = _get_I0(qbins=pipeline.compute(QBins))
+
+    first = sans.direct_beam(workflow=pipeline, I0=I0, niter=1)
+    results = sans.direct_beam(workflow=pipeline, I0=I0, niter=4, tolerance=np.inf)
+    assert len(results) == 1
+    assert sc.identical(results[0]['iofq_full'], first[0]['iofq_full'])
+
+    # The direct beam starts out flat, so these are the changes in the first two
+    # iterations
+    second = sans.direct_beam(workflow=pipeline, I0=I0, niter=2)
+    db0 = first[-1]['direct_beam']
+    db1 = second[-1]['direct_beam']
+    delta0 = np.nanmax(np.abs(db0.values - 1.0))
+    delta1 = np.nanmax(np.abs((db1 / db0).values - 1.0))
+    assert delta1 < delta0
+    niter = 4
+    results = sans.direct_beam(
+        workflow=pipeline, I0=I0, niter=niter, tolerance=0.5 * (delta0 + delta1)
+    )
+    assert 1 < len(results) < niter
+
+
+def test_direct_beam_without_history_returns_only_last_iteration():
+    n_wavelength_bands = 10
+    pipeline = make_workflow()
+    edges = pipeline.compute(WavelengthBins)
+    pipeline[WavelengthBands] = sc.linspace(
+        'wavelength', edges.min(), edges.max(), n_wavelength_bands + 1
+    )
+    pipeline[BeamCenter] = sc.vector([0, 0, 0], unit='m')
+    I0 = _get_I0(qbins=pipeline.compute(QBins))
+
+    results = sans.direct_beam(workflow=pipeline, I0=I0, niter=2, history=False)
+    full = sans.direct_beam(workflow=pipeline, I0=I0, niter=2)
+    assert len(results) == 1
+    assert len(full) == 2
+    for key, value in results[0].items():
+        assert sc.identical(value, full[-1][key], equal_nan=True)
+
+
 def test_can_compute_direct_beam_with_overlapping_wavelength_bands():
     n_wavelength_bands = 10
     # Bands have double the width
@@ -9,10 +9,12 @@ import scipp as sc
 from ess import loki
 from ess.loki import LokiAtLarmorWorkflow
 from ess.reduce import workflow
+from ess.sans import SansWorkflow
 from ess.sans.types import (
     BackgroundRun,
     BackgroundSubtractedIofQ,
     BeamCenter,
+    DetectorBankSizes,
     Filename,
     IofQ,
     PixelMaskFilename,
@@ -38,6 +40,11 @@ def test_sans_workflow_registers_subclasses():
     assert len(workflow.workflow_registry) == count + 1
 
 
+def test_sans_workflow_instances_do_not_share_mutable_defaults():
+    SansWorkflow().compute(DetectorBankSizes)['leak'] = 1
+    assert SansWorkflow().compute(DetectorBankSizes) == {}
+
+
 def test_loki_workflow_parameters_returns_filtered_params():
     wf = LokiAtLarmorWorkflow()
     parameters = workflow.get_parameters(wf, (IofQ[SampleRun],))